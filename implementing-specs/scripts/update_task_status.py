@@ -13,15 +13,58 @@ Example:
     python update_task_status.py specs/defects/pagination/tasks.md T005 pending
 """
 
+import os
 import sys
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import Iterator, Literal, Tuple
 
 Status = Literal["pending", "completed"]
 
 VALID_STATUSES = ["pending", "completed"]
 
+# Task identifier: T001, T042, etc.
+TASK_ID_RE = re.compile(r"^T\d{3}$")
+
+# Match checkbox tasks: - [ ] T001: Description  or  - [x] T001: Description
+TASK_LINE_RE = re.compile(r"- \[([ x])\] (T\d{3}):\s+(.+?)$")
+
+
+@lru_cache(maxsize=256)
+def _compile_task_pattern(task_id: str) -> "re.Pattern[bytes]":
+    """Compile the checkbox pattern for a single task ID."""
+    # Pattern matches: - [ ] T001: Task description  or  - [x] T001: Task description
+    return re.compile(rb"- \[([ x])\] " + re.escape(task_id.encode("utf-8")) + rb":")
+
+
+def _iter_checkbox_lines(data: bytes) -> Iterator[Tuple[int, bytes]]:
+    """
+    Yield (offset, line) for each line of data that starts with a checkbox ("- [").
+
+    Candidate lines are located with bytes.find, so prose, headings and code
+    blocks are skipped without being split out or decoded.
+    """
+    if data.startswith(b"- ["):
+        start = 0
+    else:
+        i = data.find(b"\n- [")
+        if i < 0:
+            return
+        start = i + 1
+
+    while True:
+        end = data.find(b"\n", start)
+        if end < 0:
+            end = len(data)
+        yield start, data[start:end]
+
+        i = data.find(b"\n- [", end)
+        if i < 0:
+            return
+        start = i + 1
+
+
 def update_task_status(tasks_file: Path, task_id: str, new_status: Status) -> bool:
     """
     Update the status of a specific task in tasks.md.
@@ -34,23 +77,30 @@ def update_task_status(tasks_file: Path, task_id: str, new_status: Status) -> bo
     Returns:
         True if update was successful, False otherwise
     """
-    if not tasks_file.exists():
-        print(f"Error: Tasks file not found: {tasks_file}", file=sys.stderr)
-        return False
-
     if new_status not in VALID_STATUSES:
         print(f"Error: Invalid status '{new_status}'. Must be one of: {', '.join(VALID_STATUSES)}", file=sys.stderr)
         return False
 
-    content = tasks_file.read_text()
-
-    # Pattern matches: - [ ] T001: Task description  or  - [x] T001: Task description
-    task_pattern = rf"^- \[([ x])\] {task_id}:"
-
-    checkbox = " " if new_status == "pending" else "x"
-    replacement = f"- [{checkbox}] {task_id}:"
+    try:
+        data = tasks_file.read_bytes()
+    except FileNotFoundError:
+        print(f"Error: Tasks file not found: {tasks_file}", file=sys.stderr)
+        return False
 
-    updated_content, count = re.subn(task_pattern, replacement, content, flags=re.MULTILINE)
+    checkbox = b" " if new_status == "pending" else b"x"
+
+    # Record the byte offset of each matching checkbox; only checkbox lines
+    # mentioning the task ID reach the regex
+    task_pattern = _compile_task_pattern(task_id)
+    task_id_bytes = task_id.encode("utf-8")
+    offsets = []
+    for start, line in _iter_checkbox_lines(data):
+        if task_id_bytes not in line:
+            continue
+        match = task_pattern.match(line)
+        if match:
+            offsets.append(start + match.start(1))
+    count = len(offsets)
 
     if count == 0:
         print(f"Warning: Task {task_id} not found in {tasks_file}", file=sys.stderr)
@@ -59,35 +109,49 @@ def update_task_status(tasks_file: Path, task_id: str, new_status: Status) -> bo
     if count > 1:
         print(f"Warning: Multiple matches found for {task_id}. Updated {count} occurrences.", file=sys.stderr)
 
-    tasks_file.write_text(updated_content)
+    # Flipping a checkbox never changes the file length, so overwrite just
+    # the checkbox bytes in place rather than rewriting the whole file
+    changed = [offset for offset in offsets if data[offset:offset + 1] != checkbox]
+    if changed:
+        fd = os.open(tasks_file, os.O_WRONLY)
+        try:
+            for offset in changed:
+                os.lseek(fd, offset, os.SEEK_SET)
+                os.write(fd, checkbox)
+        finally:
+            os.close(fd)
+
     print(f"✓ Updated {task_id} to '{new_status}'")
     return True
 
 
 def list_tasks(tasks_file: Path) -> None:
     """List all tasks in the tasks.md file with their current status."""
-    if not tasks_file.exists():
+    try:
+        data = tasks_file.read_bytes()
+    except FileNotFoundError:
         print(f"Error: Tasks file not found: {tasks_file}", file=sys.stderr)
         return
 
-    content = tasks_file.read_text()
-
-    # Match checkbox tasks: - [ ] T001: Description  or  - [x] T001: Description
-    pattern = r"^- \[([ x])\] (T\d{3}):\s+(.+?)$"
+    rule = "-" * 80 + "\n"
+    out = [f"\nTasks in {tasks_file}:\n", rule]
 
-    print(f"\nTasks in {tasks_file}:")
-    print("-" * 80)
+    for _, raw_line in _iter_checkbox_lines(data):
+        match = TASK_LINE_RE.match(raw_line.decode("utf-8"))
+        if not match:
+            continue
 
-    for match in re.finditer(pattern, content, re.MULTILINE):
         checkbox = match.group(1)
         task_id = match.group(2)
         description = match.group(3).strip()
 
         status = "completed" if checkbox == "x" else "pending"
 
-        print(f"{task_id}: {description[:60]}... [{status}]")
+        suffix = "..." if len(description) > 60 else ""
+        out.append(f"{task_id}: {description:.60}{suffix} [{status}]\n")
 
-    print("-" * 80)
+    out.append(rule)
+    sys.stdout.write("".join(out))
 
 
 def main():
@@ -111,7 +175,7 @@ def main():
     task_id = sys.argv[2].upper()
     new_status = sys.argv[3].lower()
 
-    if not re.match(r"^T\d{3}$", task_id):
+    if not TASK_ID_RE.match(task_id):
         print(f"Error: Invalid task ID format '{task_id}'. Expected format: T001, T042, etc.", file=sys.stderr)
         sys.exit(1)
 
@@ -6,16 +6,23 @@ This script ensures that all required artifacts from spec-driven-dev are present
 and well-formed before beginning implementation.
 
 Usage:
-    python validate_spec_artifacts.py <spec_directory>
+    python validate_spec_artifacts.py [--jobs N] <spec_directory> [<spec_directory> ...]
+
+Several spec directories can be validated in one run; --jobs N spreads them
+across N worker processes.
 
 Example:
     python validate_spec_artifacts.py specs/features/autocomplete-improvements
     python validate_spec_artifacts.py specs/defects/pagination-bug
+    python validate_spec_artifacts.py --jobs 4 specs/features/* specs/defects/*
 """
 
+import os
+import re
+import stat
 import sys
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 # Required files
 REQUIRED_FILES = ["requirements.md", "plan.md", "tasks.md"]
@@ -38,53 +45,83 @@ TASKS_SECTIONS = [
     "## Phase"
 ]
 
+# Checkbox task with T### identifier: - [ ] T001: ...
+TASK_PATTERN = r"^- \[([ x])\] T\d{3}:"
+TASK_RE = re.compile(TASK_PATTERN, re.MULTILINE)
+
+# One alternation over every known section heading, so a file is scanned once
+# rather than once per section. Longest first so overlapping headings prefer
+# the more specific match.
+SECTIONS_RE = re.compile("|".join(
+    re.escape(s)
+    for s in sorted(set(REQUIREMENTS_SECTIONS + PLAN_SECTIONS + TASKS_SECTIONS), key=len, reverse=True)
+))
+
 
 class ValidationError(Exception):
     """Validation error exception."""
     pass
 
 
-def validate_file_exists(spec_dir: Path, filename: str) -> Path:
-    """Validate that a required file exists."""
+def _read_text(path: Path) -> str:
+    """Read a whole file as UTF-8 without the text-mode I/O stack."""
+    return path.read_bytes().decode("utf-8")
+
+
+def validate_file_exists(spec_dir: Path, entries: Dict[str, os.DirEntry], filename: str) -> Tuple[Path, int]:
+    """
+    Validate that a required file exists among the spec directory's entries.
+
+    Returns the file's path and size in bytes. The existence check is free
+    from the directory listing; is_file() usually is too (it stats only for
+    symlinks), but on POSIX the size still costs one stat() per file.
+
+    Names not found verbatim in the listing fall back to a single os.stat(),
+    so case-insensitive filesystems still accept e.g. Tasks.md.
+    """
+    entry = entries.get(filename)
+    if entry is not None:
+        if not entry.is_file():
+            raise ValidationError(f"{filename} exists but is not a file")
+        return Path(entry.path), entry.stat().st_size
+
     file_path = spec_dir / filename
-    if not file_path.exists():
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
         raise ValidationError(f"Missing required file: {filename}")
-    if not file_path.is_file():
+    if not stat.S_ISREG(st.st_mode):
         raise ValidationError(f"{filename} exists but is not a file")
-    return file_path
+    return file_path, st.st_size
 
 
-def validate_file_sections(file_path: Path, required_sections: List[str]) -> None:
-    """Validate that a file contains all required sections."""
-    content = file_path.read_text()
+def validate_file_sections(filename: str, content: str, required_sections: List[str]) -> None:
+    """Validate that a file's content contains all required sections."""
+    found = set(SECTIONS_RE.findall(content))
 
-    missing_sections = []
-    for section in required_sections:
-        if section not in content:
-            missing_sections.append(section)
+    # Matches don't overlap, so confirm any apparent miss with a plain search
+    missing_sections = [
+        section for section in required_sections
+        if section not in found and section not in content
+    ]
 
     if missing_sections:
         raise ValidationError(
-            f"{file_path.name} is missing required sections:\n"
+            f"{filename} is missing required sections:\n"
             + "\n".join(f"  - {s}" for s in missing_sections)
         )
 
 
-def validate_tasks_format(tasks_file: Path) -> None:
-    """Validate that tasks.md contains properly formatted tasks."""
-    content = tasks_file.read_text()
-
+def validate_tasks_format(content: str) -> None:
+    """Validate that tasks.md content contains properly formatted tasks."""
     # Check for at least one task with T### format in checkbox
-    import re
-    task_pattern = r"^- \[([ x])\] T\d{3}:"
-
-    if not re.search(task_pattern, content, re.MULTILINE):
+    if not TASK_RE.search(content):
         raise ValidationError(
             "tasks.md does not contain any tasks in the expected format (- [ ] T001: ...)"
         )
 
 
-def validate_spec_directory(spec_dir: Path) -> Tuple[bool, List[str]]:
+def validate_spec_directory(spec_dir: Path) -> Tuple[bool, List[str], Dict[str, int]]:
     """
     Validate that a spec directory contains all required artifacts.
 
@@ -92,63 +129,115 @@ def validate_spec_directory(spec_dir: Path) -> Tuple[bool, List[str]]:
         spec_dir: Path to the spec directory (e.g., specs/features/autocomplete)
 
     Returns:
-        Tuple of (success: bool, errors: List[str])
+        Tuple of (success: bool, errors: List[str], file_sizes: Dict[str, int])
     """
     errors = []
+    file_sizes = {}
 
-    # Check directory exists
-    if not spec_dir.exists():
-        return False, [f"Spec directory does not exist: {spec_dir}"]
-
-    if not spec_dir.is_dir():
-        return False, [f"Path is not a directory: {spec_dir}"]
+    # List the directory once; this also checks that it exists
+    try:
+        with os.scandir(spec_dir) as it:
+            entries = {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        return False, [f"Spec directory does not exist: {spec_dir}"], file_sizes
+    except NotADirectoryError:
+        return False, [f"Path is not a directory: {spec_dir}"], file_sizes
+    except OSError as e:
+        return False, [f"Cannot read spec directory {spec_dir}: {e.strerror}"], file_sizes
 
     try:
         # Validate required files exist
-        requirements_file = validate_file_exists(spec_dir, "requirements.md")
-        plan_file = validate_file_exists(spec_dir, "plan.md")
-        tasks_file = validate_file_exists(spec_dir, "tasks.md")
+        requirements_file, file_sizes["requirements.md"] = validate_file_exists(spec_dir, entries, "requirements.md")
+        plan_file, file_sizes["plan.md"] = validate_file_exists(spec_dir, entries, "plan.md")
+        tasks_file, file_sizes["tasks.md"] = validate_file_exists(spec_dir, entries, "tasks.md")
 
-        # Validate file contents
-        validate_file_sections(requirements_file, REQUIREMENTS_SECTIONS)
-        validate_file_sections(plan_file, PLAN_SECTIONS)
-        validate_file_sections(tasks_file, TASKS_SECTIONS)
+        # Read each file once and validate its contents
+        tasks_content = _read_text(tasks_file)
+        validate_file_sections(requirements_file.name, _read_text(requirements_file), REQUIREMENTS_SECTIONS)
+        validate_file_sections(plan_file.name, _read_text(plan_file), PLAN_SECTIONS)
+        validate_file_sections(tasks_file.name, tasks_content, TASKS_SECTIONS)
 
         # Validate tasks format
-        validate_tasks_format(tasks_file)
+        validate_tasks_format(tasks_content)
 
     except ValidationError as e:
         errors.append(str(e))
 
-    return len(errors) == 0, errors
+    return len(errors) == 0, errors, file_sizes
 
 
-def main():
-    if len(sys.argv) != 2:
-        print(__doc__)
-        sys.exit(1)
+def _parse_args(argv: List[str]) -> Tuple[List[Path], int]:
+    """Split argv into spec directories and the --jobs worker count (default 1)."""
+    spec_dirs = []
+    jobs = 1
+    args = iter(argv)
+    for arg in args:
+        value: Optional[str] = None
+        if arg == "--jobs":
+            value = next(args, None)
+        elif arg.startswith("--jobs="):
+            value = arg.split("=", 1)[1]
+        else:
+            spec_dirs.append(Path(arg))
+            continue
+
+        if value is None or not value.isdigit() or int(value) < 1:
+            print("Error: --jobs requires a positive integer", file=sys.stderr)
+            sys.exit(1)
+        jobs = int(value)
 
-    spec_dir = Path(sys.argv[1])
+    return spec_dirs, jobs
 
+
+def _print_result(spec_dir: Path, success: bool, errors: List[str], file_sizes: Dict[str, int]) -> None:
+    """Print the validation report for a single spec directory."""
     print(f"Validating spec artifacts in: {spec_dir}")
     print("-" * 80)
 
-    success, errors = validate_spec_directory(spec_dir)
-
     if success:
         print("✅ All spec artifacts are valid and ready for implementation!")
         print("-" * 80)
         print("\nFound files:")
         for filename in REQUIRED_FILES:
-            file_path = spec_dir / filename
-            size = file_path.stat().st_size
-            print(f"  ✓ {filename} ({size} bytes)")
-        sys.exit(0)
+            print(f"  ✓ {filename} ({file_sizes[filename]} bytes)")
     else:
         print("❌ Validation failed with the following errors:\n")
         for error in errors:
             print(f"  • {error}")
         print("\n" + "-" * 80)
+
+
+def main():
+    spec_dirs, jobs = _parse_args(sys.argv[1:])
+    if not spec_dirs:
+        print(__doc__)
+        sys.exit(1)
+
+    # Module-level patterns are compiled once per process and reused for every
+    # directory; with --jobs each worker amortizes them over its share.
+    if jobs > 1 and len(spec_dirs) > 1:
+        # Imported here: concurrent.futures pulls in multiprocessing and
+        # logging, which would roughly double startup for the common case
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            results = list(executor.map(validate_spec_directory, spec_dirs))
+    else:
+        results = [validate_spec_directory(spec_dir) for spec_dir in spec_dirs]
+
+    failed = 0
+    for i, (spec_dir, (success, errors, file_sizes)) in enumerate(zip(spec_dirs, results)):
+        if i:
+            print()
+        _print_result(spec_dir, success, errors, file_sizes)
+        if not success:
+            failed += 1
+
+    if len(spec_dirs) > 1:
+        print("\n" + "=" * 80)
+        print(f"Summary: {len(spec_dirs) - failed} of {len(spec_dirs)} spec directories valid")
+
+    if failed:
         print("\nPlease ensure spec-driven-dev has completed successfully before")
         print("running implementation. The spec directory should contain:")
         print("  - requirements.md (with Overview, Requirements)")
@@ -156,6 +245,8 @@ def main():
         print("  - tasks.md (with Phase sections and checkbox tasks: - [ ] T001: ...)")
         sys.exit(1)
 
+    sys.exit(0)
+
 
 if __name__ == "__main__":
     main()
@@ -12,11 +12,20 @@ Example:
     python validate_skill_alignment.py --skills-dir /Users/floyda/.claude/skills
 """
 
+import importlib.util
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Tuple
 
+# Template extraction
+_TEMPLATE_HEADING_RE = re.compile(r'## (requirements|plan|tasks)\.md Template', re.IGNORECASE)
+_MARKDOWN_BLOCK_RE = re.compile(r'```markdown(.*?)```', re.DOTALL)
+_SECTION_HEADER_RE = re.compile(r'^(##\s+[A-Za-z\s]+)', re.MULTILINE)
+_PHASE_HEADER_RE = re.compile(r'^##\s+(Phase[^:]*)', re.MULTILINE)
+_TASK_EXAMPLE_RE = re.compile(r'^- \[ \] (T\d+:.*?)$', re.MULTILINE)
+
 
 class AlignmentIssue:
     def __init__(self, severity: str, component: str, message: str):
@@ -29,61 +38,32 @@ class AlignmentIssue:
         return f"{icon} [{self.component}] {self.message}"
 
 
-def extract_validation_expectations(validator_script: Path) -> dict:
-    """Extract what the validation script expects."""
-    content = validator_script.read_text()
+def _read_text(path: Path) -> str:
+    """Read a whole file as UTF-8 without the text-mode I/O stack."""
+    return path.read_bytes().decode("utf-8")
 
-    expectations = {
-        "requirements_sections": [],
-        "plan_sections": [],
-        "tasks_sections": [],
-        "task_pattern": None
-    }
 
-    # Extract requirements sections
-    req_match = re.search(
-        r'REQUIREMENTS_SECTIONS\s*=\s*\[(.*?)\]',
-        content,
-        re.DOTALL
-    )
-    if req_match:
-        sections = re.findall(r'"([^"]+)"', req_match.group(1))
-        expectations["requirements_sections"] = sections
-
-    # Extract plan sections
-    plan_match = re.search(
-        r'PLAN_SECTIONS\s*=\s*\[(.*?)\]',
-        content,
-        re.DOTALL
-    )
-    if plan_match:
-        sections = re.findall(r'"([^"]+)"', plan_match.group(1))
-        expectations["plan_sections"] = sections
-
-    # Extract tasks sections
-    tasks_match = re.search(
-        r'TASKS_SECTIONS\s*=\s*\[(.*?)\]',
-        content,
-        re.DOTALL
-    )
-    if tasks_match:
-        sections = re.findall(r'"([^"]+)"', tasks_match.group(1))
-        expectations["tasks_sections"] = sections
-
-    # Extract task pattern
-    pattern_match = re.search(
-        r'task_pattern\s*=\s*r"([^"]+)"',
-        content
-    )
-    if pattern_match:
-        expectations["task_pattern"] = pattern_match.group(1)
-
-    return expectations
+def extract_validation_expectations(validator_script: Path) -> dict:
+    """
+    Extract what the validation script expects by importing its constants.
+
+    Note that this executes the validator module; import errors propagate.
+    """
+    spec = importlib.util.spec_from_file_location("_validator", validator_script)
+    validator = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(validator)
+
+    return {
+        "requirements_sections": list(getattr(validator, "REQUIREMENTS_SECTIONS", [])),
+        "plan_sections": list(getattr(validator, "PLAN_SECTIONS", [])),
+        "tasks_sections": list(getattr(validator, "TASKS_SECTIONS", [])),
+        "task_pattern": getattr(validator, "TASK_PATTERN", None)
+    }
 
 
 def extract_template_promises(template_file: Path) -> dict:
     """Extract what the template promises to generate."""
-    content = template_file.read_text()
+    content = _read_text(template_file)
 
     promises = {
         "requirements_sections": [],
@@ -92,57 +72,58 @@ def extract_template_promises(template_file: Path) -> dict:
         "task_format_examples": []
     }
 
-    # Find requirements.md template section
-    req_template = re.search(
-        r'## requirements\.md Template.*?```markdown(.*?)```',
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
-    if req_template:
-        template_text = req_template.group(1)
-        # Extract section headers (just the heading marker and name, not content in brackets)
-        sections = re.findall(r'^(##\s+[A-Za-z\s]+)', template_text, re.MULTILINE)
-        # Clean up sections - strip trailing spaces and ensure format
-        sections = [s.strip() for s in sections]
-        promises["requirements_sections"] = sections
-
-    # Find plan.md template section
-    plan_template = re.search(
-        r'## plan\.md Template.*?```markdown(.*?)```',
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
-    if plan_template:
-        template_text = plan_template.group(1)
-        # Extract section headers (just the heading marker and name, not content in brackets)
-        sections = re.findall(r'^(##\s+[A-Za-z\s]+)', template_text, re.MULTILINE)
-        sections = [s.strip() for s in sections]
-        promises["plan_sections"] = sections
-
-    # Find tasks.md template section
-    tasks_template = re.search(
-        r'## tasks\.md Template.*?```markdown(.*?)```',
-        content,
-        re.DOTALL | re.IGNORECASE
-    )
-    if tasks_template:
-        template_text = tasks_template.group(1)
+    # Find the template headings in one pass; each kind then takes the first
+    # markdown block after its own (first) heading
+    templates = {}
+    for heading in _TEMPLATE_HEADING_RE.finditer(content):
+        kind = heading.group(1).lower()
+        if kind in templates:
+            continue
+        block = _MARKDOWN_BLOCK_RE.search(content, heading.end())
+        if block is None:
+            break  # no markdown blocks remain after this heading
+        templates[kind] = block.group(1)
+
+    # requirements.md and plan.md templates
+    for kind in ("requirements", "plan"):
+        template_text = templates.get(kind)
+        if template_text is not None:
+            # Extract section headers (just the heading marker and name, not content in brackets)
+            sections = _SECTION_HEADER_RE.findall(template_text)
+            # Clean up sections - strip trailing spaces and ensure format
+            promises[f"{kind}_sections"] = [s.strip() for s in sections]
+
+    # tasks.md template
+    template_text = templates.get("tasks")
+    if template_text is not None:
         # Extract phase sections
-        sections = re.findall(r'^##\s+(Phase[^:]*)', template_text, re.MULTILINE)
+        sections = _PHASE_HEADER_RE.findall(template_text)
         if sections:
             promises["tasks_sections"] = ["## Phase"]  # Generic pattern
 
         # Extract task format examples
-        task_examples = re.findall(
-            r'^- \[ \] (T\d+:.*?)$',
-            template_text,
-            re.MULTILINE
-        )
+        task_examples = _TASK_EXAMPLE_RE.findall(template_text)
         promises["task_format_examples"] = task_examples
 
     return promises
 
 
+@lru_cache(maxsize=8)
+def _extract_cached(extractor, path: Path, mtime_ns: int) -> dict:
+    """
+    Memoize an extractor per file version; mtime_ns invalidates stale entries.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    return extractor(path)
+
+
+def _diff(expected: list, promised: list) -> Tuple[set, set, bool]:
+    """Return (missing, extra, same) for two section lists, building each set once."""
+    e, p = set(expected), set(promised)
+    return e - p, p - e, e == p
+
+
 def validate_alignment(skills_dir: Path) -> List[AlignmentIssue]:
     """Validate alignment between the two skills."""
     issues = []
@@ -151,7 +132,9 @@ def validate_alignment(skills_dir: Path) -> List[AlignmentIssue]:
     validator_script = skills_dir / "implementing-specs/scripts/validate_spec_artifacts.py"
     template_file = skills_dir / "spec-driven-dev/references/templates.md"
 
-    if not validator_script.exists():
+    try:
+        validator_mtime = validator_script.stat().st_mtime_ns
+    except FileNotFoundError:
         issues.append(AlignmentIssue(
             "error",
             "general",
@@ -159,7 +142,9 @@ def validate_alignment(skills_dir: Path) -> List[AlignmentIssue]:
         ))
         return issues
 
-    if not template_file.exists():
+    try:
+        template_mtime = template_file.stat().st_mtime_ns
+    except FileNotFoundError:
         issues.append(AlignmentIssue(
             "error",
             "general",
@@ -168,17 +153,20 @@ def validate_alignment(skills_dir: Path) -> List[AlignmentIssue]:
         return issues
 
     # Extract expectations and promises
-    expectations = extract_validation_expectations(validator_script)
-    promises = extract_template_promises(template_file)
+    try:
+        expectations = _extract_cached(extract_validation_expectations, validator_script, validator_mtime)
+    except Exception as e:
+        issues.append(AlignmentIssue(
+            "error",
+            "general",
+            f"Could not load validation script {validator_script}: {e}"
+        ))
+        return issues
+    promises = _extract_cached(extract_template_promises, template_file, template_mtime)
 
     # Validate requirements.md
-    if set(expectations["requirements_sections"]) != set(promises["requirements_sections"]):
-        expected = expectations["requirements_sections"]
-        promised = promises["requirements_sections"]
-
-        missing = set(expected) - set(promised)
-        extra = set(promised) - set(expected)
-
+    missing, extra, same = _diff(expectations["requirements_sections"], promises["requirements_sections"])
+    if not same:
         if missing:
             issues.append(AlignmentIssue(
                 "error",
@@ -193,13 +181,8 @@ def validate_alignment(skills_dir: Path) -> List[AlignmentIssue]:
             ))
 
     # Validate plan.md
-    if set(expectations["plan_sections"]) != set(promises["plan_sections"]):
-        expected = expectations["plan_sections"]
-        promised = promises["plan_sections"]
-
-        missing = set(expected) - set(promised)
-        extra = set(promised) - set(expected)
-
+    missing, extra, same = _diff(expectations["plan_sections"], promises["plan_sections"])
+    if not same:
         if missing:
             issues.append(AlignmentIssue(
                 "error",
@@ -248,26 +231,37 @@ def validate_alignment(skills_dir: Path) -> List[AlignmentIssue]:
     return issues
 
 
-def main():
-    import argparse
+def _parse_skills_dir(argv: List[str]) -> Path:
+    """Parse the single optional --skills-dir flag (default: ~/.claude/skills)."""
+    skills_dir = Path.home() / ".claude/skills"
+    args = iter(argv)
+    for arg in args:
+        if arg in ("-h", "--help"):
+            print(__doc__)
+            sys.exit(0)
+        elif arg == "--skills-dir":
+            value = next(args, None)
+            if value is None:
+                print("Error: --skills-dir requires a path", file=sys.stderr)
+                sys.exit(1)
+            skills_dir = Path(value)
+        elif arg.startswith("--skills-dir="):
+            skills_dir = Path(arg.split("=", 1)[1])
+        else:
+            print(f"Error: Unrecognized argument '{arg}'", file=sys.stderr)
+            print(__doc__)
+            sys.exit(1)
+    return skills_dir
 
-    parser = argparse.ArgumentParser(
-        description="Validate alignment between spec-driven-dev and implementing-specs"
-    )
-    parser.add_argument(
-        "--skills-dir",
-        type=Path,
-        default=Path.home() / ".claude/skills",
-        help="Path to skills directory (default: ~/.claude/skills)"
-    )
 
-    args = parser.parse_args()
+def main():
+    skills_dir = _parse_skills_dir(sys.argv[1:])
 
     print("Validating skill alignment...")
-    print(f"Skills directory: {args.skills_dir}")
+    print(f"Skills directory: {skills_dir}")
     print("-" * 80)
 
-    issues = validate_alignment(args.skills_dir)
+    issues = validate_alignment(skills_dir)
 
     if not issues:
         print("✅ All checks passed! Skills are properly aligned.")